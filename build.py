@@ -8,8 +8,13 @@ and replaces {{PLACEHOLDER}} patterns with environment variable values.
 Usage:
     python build.py               # Build to dist/ folder (staging mode, blocks crawlers)
     python build.py --production  # Build for production (allows crawlers)
-    python build.py --watch       # Watch for changes and rebuild
-    python build.py --clean       # Remove dist/ folder
+    python build.py --watch       # Watch for changes and rebuild (uses watchdog if installed)
+    python build.py --clean       # Remove dist/ folder and build cache (next build is a full rebuild)
+
+Builds are incremental: a manifest (.build-cache.json, kept outside dist/ so
+it is never deployed) records the state of each page, and unchanged pages are
+skipped. Changing header/footer, assets, build.py or any environment variable
+triggers a full rebuild.
 
 Environment variables (for placeholder replacement):
     DOMAIN          - Site domain (required)
@@ -28,10 +33,15 @@ Project structure:
 
 import os
 import re
+import json
+import mmap
+import errno
 import sys
 import shutil
 import hashlib
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 # Configuration
@@ -39,10 +49,15 @@ PROJECT_ROOT = Path(__file__).parent
 SRC_DIR = PROJECT_ROOT / "src"
 DIST_DIR = PROJECT_ROOT / "dist"
 COMPONENTS_DIR = SRC_DIR / "components"
+MANIFEST_FILE = PROJECT_ROOT / ".build-cache.json"
 
 # Files/folders to copy as-is (not processed)
 COPY_AS_IS = ["assets", "components"]
 
+# Minimum number of HTML files to process in parallel worker processes
+# (below this, starting the workers costs more than it saves)
+PARALLEL_MIN_FILES = 50
+
 # SEO files
 ROBOTS_STAGING = SRC_DIR / "robots.txt.staging"
 ROBOTS_PRODUCTION = SRC_DIR / "robots.txt.production"
@@ -52,6 +67,21 @@ SITEMAP_FILE = SRC_DIR / "sitemap.xml"
 HEADER_MARKER = '<div id="header"></div>'
 FOOTER_MARKER = '<div id="footer"></div>'
 
+# Precompiled patterns (used for every HTML file)
+# href= or src= pointing to local asset folders (with optional leading /)
+ASSET_REF_PATTERN = re.compile(r'((?:href|src)=)(["\'])(/?assets/(?:css|js|images|documents)/[^"\'?]+)\2')
+# Navigation links with a data-page attribute (page name captured in group 2)
+DATA_PAGE_PATTERN = re.compile(r'(<a[^>]*data-page="([^"]+)"[^>]*>)([^<]*)(</a>)')
+# {{PLACEHOLDER}} patterns (key captured in group 1)
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([A-Z_]+)\}\}')
+# Placeholders, header/footer markers and asset references in a single pass
+HTML_REWRITE_PATTERN = re.compile(
+    r'\{\{(?P<placeholder>[A-Z_]+)\}\}'
+    r'|(?P<header>' + re.escape(HEADER_MARKER) + r')'
+    r'|(?P<footer>' + re.escape(FOOTER_MARKER) + r')'
+    r'|(?P<attr>(?:href|src)=)(?P<quote>["\'])(?P<path>/?assets/(?:css|js|images|documents)/[^"\'?]+)(?P=quote)'
+)
+
 
 def get_env_vars() -> dict:
     """Get configuration from environment variables."""
@@ -88,12 +118,25 @@ def get_env_vars() -> dict:
     }
 
 
-def replace_placeholders(content: str, env_vars: dict) -> str:
-    """Replace {{PLACEHOLDER}} patterns with environment variable values."""
-    for key, value in env_vars.items():
-        placeholder = f'{{{{{key}}}}}'  # {{KEY}}
-        content = content.replace(placeholder, value)
-    return content
+class PlaceholderReplacer:
+    """
+    Replace {{PLACEHOLDER}} patterns with environment variable values.
+
+    Built once per build (the environment does not change during a build) and
+    picklable, so it can be passed to worker processes. `values` is exposed for
+    callers that already matched a placeholder themselves.
+    """
+
+    def __init__(self, env_vars: dict):
+        self.values = dict(env_vars)
+
+    def __call__(self, content: str) -> str:
+        # Single pass over the content; unknown placeholders are left untouched
+        return PLACEHOLDER_PATTERN.sub(self.substitute, content)
+
+    def substitute(self, match: re.Match) -> str:
+        """Value for a PLACEHOLDER_PATTERN match (unchanged if unknown)."""
+        return self.values.get(match.group(1), match.group(0))
 
 
 def read_file(path: Path) -> str:
@@ -102,40 +145,157 @@ def read_file(path: Path) -> str:
         return f.read()
 
 
-def write_file(path: Path, content: str) -> None:
-    """Write content to file with UTF-8 encoding."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+def write_file(path: Path, content: str | bytes, create_dirs: bool = True) -> None:
+    """Write content to file, encoding text as UTF-8 (bytes are written as-is)."""
+    if create_dirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    path.write_bytes(content)
 
 
 def get_file_hash(filepath: Path) -> str:
-    """Compute a short MD5 hash of a file's content for cache busting."""
-    content = filepath.read_bytes()
-    return hashlib.md5(content).hexdigest()[:8]
+    """
+    Compute a short BLAKE2b hash of a file's content for cache busting.
+
+    The content is hashed straight from the file (hashlib.file_digest on Python 3.11+,
+    a memory map otherwise) without being copied to a bytes object.
+    """
+    with open(filepath, "rb") as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=4)).hexdigest()
+
+        file_hash = hashlib.blake2b(digest_size=4)
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                file_hash.update(mm)
+        return file_hash.hexdigest()
+
+
+def get_asset_hashes(previous: dict) -> dict:
+    """
+    Hash the files under src/assets, as {relative_path: [size, mtime_ns, hash]}.
+
+    Hashes recorded by the previous build (in the manifest) are reused for
+    files whose size and mtime_ns are unchanged, so only new or modified
+    assets are read. Computed in the main process and passed to page workers.
+    """
+    assets_dir = SRC_DIR / "assets"
+    if not assets_dir.exists():
+        return {}
+
+    assets = {}
+    for path in assets_dir.rglob("*"):
+        if not path.is_file():
+            continue
+        stat = path.stat()
+        relative = path.relative_to(SRC_DIR).as_posix()
+        entry = previous.get(relative)
+        if entry and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+            assets[relative] = entry
+        else:
+            assets[relative] = [stat.st_size, stat.st_mtime_ns, get_file_hash(path)]
+    return assets
+
+
+def get_script_hash() -> str:
+    """Compute a hash of build.py itself (it defines how the output is built)."""
+    return hashlib.md5(Path(__file__).read_bytes()).hexdigest()
+
+
+def hash_env_vars(env_vars: dict) -> str:
+    """Compute a hash of the environment variables used for the build."""
+    serialized = json.dumps(env_vars, sort_keys=True).encode("utf-8")
+    return hashlib.md5(serialized).hexdigest()
+
+
+def get_components_fingerprint(assets: dict, script_hash: str) -> str:
+    """
+    Compute a fingerprint of everything shared by every page.
+
+    Header/footer are injected in every page, asset hashes are embedded in
+    cache-busting query strings and build.py defines the output itself, so a
+    change to any of them invalidates all built pages. `assets` comes from
+    get_asset_hashes(): added, deleted or modified assets all change the
+    fingerprint.
+    """
+    fingerprint = hashlib.md5(script_hash.encode("utf-8"))
+    for path in (COMPONENTS_DIR / "header.html", COMPONENTS_DIR / "footer.html"):
+        if path.exists():
+            stat = path.stat()
+            fingerprint.update(f"{path.name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    for relative, (_size, _mtime_ns, file_hash) in sorted(assets.items()):
+        fingerprint.update(f"{relative}\0{file_hash}\n".encode("utf-8"))
+    return fingerprint.hexdigest()
+
+
+def load_manifest() -> dict:
+    """Load the build manifest from the previous build, if any."""
+    if MANIFEST_FILE.exists():
+        try:
+            return json.loads(read_file(MANIFEST_FILE))
+        except json.JSONDecodeError:
+            print(f"Warning: invalid {MANIFEST_FILE.name}, doing a full rebuild")
+    return {}
 
 
-def add_cache_busting(content: str) -> str:
+def save_manifest(manifest: dict) -> None:
+    """Save the build manifest for the next incremental build."""
+    write_file(MANIFEST_FILE, json.dumps(manifest, indent=2, sort_keys=True))
+
+
+def walk_html(root: str | os.PathLike = SRC_DIR, top_level: bool = True):
+    """
+    Yield os.DirEntry objects for HTML files under root, excluding COPY_AS_IS folders.
+
+    Uses os.scandir, so file and directory types come from the directory
+    listing without a stat() per entry. On POSIX, DirEntry.stat() still
+    makes one stat call per file (cached on the entry afterwards).
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if top_level and entry.name in COPY_AS_IS:
+                    continue
+                yield from walk_html(entry.path, top_level=False)
+            elif entry.name.endswith(".html"):
+                yield entry
+
+
+def needs_rebuild(src_mtime_ns: int, dst: Path, entry: list | None) -> bool:
+    """
+    Check if dst is missing or its source changed since the previous build.
+
+    The source mtime is compared with the one recorded in the manifest entry
+    rather than with the output's mtime, so a save landing in the same
+    timestamp tick as the previous write is not missed.
+    """
+    return entry is None or not dst.exists() or entry[0] != src_mtime_ns
+
+
+def cache_bust_ref(attr: str, quote: str, path: str, asset_hashes: dict) -> str:
+    """Build an asset reference with a ?v=HASH query string if the file exists."""
+    # Strip leading slash for lookup relative to src/
+    file_hash = asset_hashes.get(path.lstrip('/'))
+    if file_hash:
+        return f'{attr}{quote}{path}?v={file_hash}{quote}'
+    return f'{attr}{quote}{path}{quote}'
+
+
+def add_cache_busting(content: str, asset_hashes: dict) -> str:
     """Add ?v=HASH query strings to local asset references (CSS, JS, images, documents)."""
     def replace_asset_ref(match):
         attr = match.group(1)  # href= or src=
         quote = match.group(2)  # quote character
         path = match.group(3)  # e.g. /assets/css/custom.css
-        # Strip leading slash for filesystem lookup
-        clean_path = path.lstrip('/')
-        filepath = SRC_DIR / clean_path
-        if filepath.exists():
-            file_hash = get_file_hash(filepath)
-            return f'{attr}{quote}{path}?v={file_hash}{quote}'
-        return match.group(0)
+        return cache_bust_ref(attr, quote, path, asset_hashes)
 
-    # Match href= or src= pointing to local asset folders (with optional leading /)
-    pattern = r'((?:href|src)=)(["\'])(/?assets/(?:css|js|images|documents)/[^"\'?]+)\2'
-    return re.sub(pattern, replace_asset_ref, content)
+    return ASSET_REF_PATTERN.sub(replace_asset_ref, content)
 
 
-def load_components(env_vars: dict) -> tuple[str, str]:
-    """Load header and footer components with placeholder replacement."""
+def load_components(replace: PlaceholderReplacer, asset_hashes: dict) -> tuple[str, str]:
+    """Load header and footer components with placeholder replacement and cache busting."""
     header_path = COMPONENTS_DIR / "header.html"
     footer_path = COMPONENTS_DIR / "footer.html"
 
@@ -146,38 +306,56 @@ def load_components(env_vars: dict) -> tuple[str, str]:
         print(f"ERROR: {footer_path} not found!")
         sys.exit(1)
 
-    header = replace_placeholders(read_file(header_path), env_vars)
-    footer = replace_placeholders(read_file(footer_path), env_vars)
+    header = add_cache_busting(replace(read_file(header_path)), asset_hashes)
+    footer = add_cache_busting(replace(read_file(footer_path)), asset_hashes)
 
     return header, footer
 
 
-def process_html(content: str, header: str, footer: str, filename: str, env_vars: dict) -> str:
+def process_html(content: str, header: str, footer: str, filename: str,
+                 replace: PlaceholderReplacer, asset_hashes: dict) -> str:
     """
     Process an HTML file:
     1. Replace {{PLACEHOLDER}} patterns with env values
     2. Replace header marker with actual header content
     3. Replace footer marker with actual footer content
-    4. Add active page marker to navigation
+    4. Add cache-busting hashes to local asset references
+    5. Add active page marker to navigation
+
+    Steps 1-4 are done in a single regex pass; header and footer are expected
+    to be already processed by load_components(). `asset_hashes` maps asset
+    paths (relative to src/) to their hash.
     """
-    # Replace placeholders first
-    processed = replace_placeholders(content, env_vars)
+    header_block = f"<!-- HEADER -->\n{header}\n<!-- /HEADER -->"
+    footer_block = f"<!-- FOOTER -->\n{footer}\n<!-- /FOOTER -->"
+
+    def rewrite(match):
+        kind = match.lastgroup
+        if kind == 'placeholder':
+            return replace.values.get(match.group('placeholder'), match.group(0))
+        if kind == 'header':
+            return header_block
+        if kind == 'footer':
+            return footer_block
+        # Asset reference (may itself contain placeholders)
+        path = match.group('path')
+        if '{{' in path:
+            path = replace(path)
+        return cache_bust_ref(match.group('attr'), match.group('quote'), path, asset_hashes)
+
+    processed = HTML_REWRITE_PATTERN.sub(rewrite, content)
 
     # Get page name for active link marking
     page_name = Path(filename).stem  # e.g., "index", "contact", "historique"
 
-    # Replace markers with actual content
-    processed = processed.replace(HEADER_MARKER, f"<!-- HEADER -->\n{header}\n<!-- /HEADER -->")
-    processed = processed.replace(FOOTER_MARKER, f"<!-- FOOTER -->\n{footer}\n<!-- /FOOTER -->")
-
     # Mark active page in navigation
     # Find links with data-page attribute matching current page
-    pattern = rf'(<a[^>]*data-page="{page_name}"[^>]*>)([^<]*)(</a>)'
-
     def mark_active(match):
+        if match.group(2) != page_name:
+            return match.group(0)
         opening = match.group(1)
-        text = match.group(2)
-        closing = match.group(3)
+        text = match.group(3)
+        closing = match.group(4)
         # Add active class and bold text
         if 'class="' in opening:
             opening = opening.replace('class="', 'class="active ')
@@ -185,19 +363,161 @@ def process_html(content: str, header: str, footer: str, filename: str, env_vars
             opening = opening.replace('>', ' class="active">')
         return f'{opening}<strong>{text}</strong>{closing}'
 
-    processed = re.sub(pattern, mark_active, processed)
+    return DATA_PAGE_PATTERN.sub(mark_active, processed)
+
+
+def process_page(html_file: Path, entry: list | None, header: str, footer: str,
+                 replace: PlaceholderReplacer, asset_hashes: dict) -> tuple[list, str, bytes | None]:
+    """
+    Process a single HTML page (run in worker processes).
+
+    Returns (manifest_entry, action, output) where action is one of
+    "skipped", "touched", "static", "processed" or "copied". Output (UTF-8
+    encoded) is only set for "processed" and "copied"; writing it, or copying
+    "static" pages as-is, is left to the caller.
+    """
+    out_path = DIST_DIR / html_file.relative_to(SRC_DIR)
+    src_mtime_ns = html_file.stat().st_mtime_ns
+
+    # Source unchanged since previous build: nothing to do
+    # (component changes force a full rebuild, without previous entries)
+    if not needs_rebuild(src_mtime_ns, out_path, entry):
+        return entry, "skipped", None
 
-    # Add cache-busting hashes to local CSS/JS references
-    processed = add_cache_busting(processed)
+    raw = html_file.read_bytes()
+    content_hash = hashlib.md5(raw).hexdigest()
+    new_entry = [src_mtime_ns, content_hash]
 
-    return processed
+    # Source touched but content unchanged: only the manifest entry needs updating
+    if entry and entry[1] == content_hash and out_path.exists():
+        return new_entry, "touched", None
+
+    # No markers, placeholders or CR line endings: nothing to transform, copy as-is
+    if (b"{{" not in raw and b"\r" not in raw
+            and HEADER_MARKER.encode() not in raw and FOOTER_MARKER.encode() not in raw):
+        return new_entry, "static", None
+
+    # Normalize line endings to LF, as text-mode reading does
+    content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    # Check if file has markers
+    if HEADER_MARKER in content or FOOTER_MARKER in content:
+        processed = process_html(content, header, footer, html_file.name, replace, asset_hashes)
+        return new_entry, "processed", processed.encode("utf-8")
+
+    # Still apply placeholder replacement
+    return new_entry, "copied", replace(content).encode("utf-8")
+
+
+def copy_in_kernel(src_fd: int, dst_fd: int, size: int) -> None:
+    """
+    Copy size bytes between file descriptors without going through user space.
+
+    Tries os.copy_file_range (reflink on Btrfs/XFS), then os.sendfile.
+    Raises OSError if neither is supported for these files or the copy ends
+    before size bytes.
+    """
+    use_copy_range = hasattr(os, "copy_file_range")
+    if not use_copy_range and not hasattr(os, "sendfile"):
+        raise OSError(errno.ENOSYS, "No in-kernel copy available")
+
+    offset = 0
+    while offset < size:
+        try:
+            if use_copy_range:
+                sent = os.copy_file_range(src_fd, dst_fd, size - offset)
+            else:
+                sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        except OSError as e:
+            # copy_file_range unsupported (old kernel, cross-device...): retry with sendfile
+            if use_copy_range and hasattr(os, "sendfile") and e.errno in (
+                errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP
+            ):
+                use_copy_range = False
+                continue
+            raise
+        if sent == 0:
+            # Early EOF from copy_file_range happens on some filesystems: retry with sendfile
+            if use_copy_range and hasattr(os, "sendfile"):
+                use_copy_range = False
+                continue
+            raise OSError(errno.EIO, f"Short copy: {offset} of {size} bytes")
+        offset += sent
+
+
+def copy_file(src, dst, *, follow_symlinks: bool = True):
+    """
+    Copy a file with in-kernel copy and preserve metadata.
+
+    Falls back to shutil.copyfile when in-kernel copy is not available.
+    """
+    size = os.stat(src, follow_symlinks=follow_symlinks).st_size
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            copy_in_kernel(fsrc.fileno(), fdst.fileno(), size)
+    except OSError:
+        shutil.copyfile(src, dst, follow_symlinks=follow_symlinks)
+    shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
+def fast_copy(src, dst, *, follow_symlinks: bool = True):
+    """
+    Copy a file unless already up to date in dist (copytree copy_function).
+
+    Files with the same size and mtime (as preserved by copystat) are skipped.
+    """
+    src_stat = os.stat(src, follow_symlinks=follow_symlinks)
+    try:
+        dst_stat = os.stat(dst)
+        if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+            return dst
+    except FileNotFoundError:
+        pass
+    return copy_file(src, dst, follow_symlinks=follow_symlinks)
+
+
+def remove_stale_files(src_dir: Path, dst_dir: Path) -> list[str]:
+    """Remove files (and emptied folders) in dst_dir that no longer exist in src_dir."""
+    removed = []
+    for dst in sorted(dst_dir.rglob("*"), reverse=True):  # children before parents
+        src = src_dir / dst.relative_to(dst_dir)
+        if dst.is_dir() and not dst.is_symlink():
+            if not src.is_dir() and not any(dst.iterdir()):
+                dst.rmdir()
+        elif not src.exists():
+            dst.unlink()
+            removed.append(dst.relative_to(DIST_DIR).as_posix())
+    return removed
+
+
+def copy_static_folders() -> tuple[list[str], list[str]]:
+    """Copy COPY_AS_IS folders/files to dist, returning the names copied and removed."""
+    copied = []
+    removed = []
+    for folder in COPY_AS_IS:
+        src = SRC_DIR / folder
+        if src.exists():
+            dst = DIST_DIR / folder
+            if src.is_dir():
+                shutil.copytree(src, dst, copy_function=fast_copy, dirs_exist_ok=True)
+                copied.append(f"{folder}/")
+                # dist/ is not wiped between builds: drop files deleted from src
+                removed.extend(remove_stale_files(src, dst))
+            else:
+                fast_copy(src, dst)
+                copied.append(folder)
+    return copied, removed
 
 
 def clean_dist():
-    """Remove the dist directory."""
+    """Remove the dist directory and the build manifest."""
     if DIST_DIR.exists():
         shutil.rmtree(DIST_DIR)
         print(f"Cleaned: {DIST_DIR}")
+    if MANIFEST_FILE.exists():
+        MANIFEST_FILE.unlink()
+        print(f"Cleaned: {MANIFEST_FILE}")
 
 
 def build(production_mode: bool = False):
@@ -208,98 +528,238 @@ def build(production_mode: bool = False):
     # Get environment variables
     env_vars = get_env_vars()
     print(f"Domain: {env_vars['DOMAIN']}")
+    replace = PlaceholderReplacer(env_vars)
 
     # Check source directory exists
     if not SRC_DIR.exists():
         print(f"ERROR: Source directory {SRC_DIR} not found!")
         sys.exit(1)
 
-    # Clean previous build
-    clean_dist()
+    # Previous build state, for incremental builds
+    manifest = load_manifest()
+    script_hash = get_script_hash()
+
+    # Hash assets once for cache busting (shared with worker processes),
+    # reusing previous hashes unless build.py (and so the hashing) changed
+    previous_assets = manifest.get('assets', {}) if manifest.get('script_hash') == script_hash else {}
+    assets = get_asset_hashes(previous_assets)
+    asset_hashes = {relative: entry[2] for relative, entry in assets.items()}
 
     # Load components (with placeholder replacement)
-    header, footer = load_components(env_vars)
+    header, footer = load_components(replace, asset_hashes)
     print(f"Loaded components from {COMPONENTS_DIR}")
 
     # Create dist directory
     DIST_DIR.mkdir(exist_ok=True)
 
+    # Copy assets in the background while HTML pages are processed
+    copy_executor = ThreadPoolExecutor(max_workers=1)
+    copy_future = copy_executor.submit(copy_static_folders)
+
+    # Compare with previous build: any env or component change forces a full rebuild
+    env_hash = hash_env_vars(env_vars)
+    components_fingerprint = get_components_fingerprint(assets, script_hash)
+    full_rebuild = (
+        manifest.get('env_hash') != env_hash
+        or manifest.get('components_fingerprint') != components_fingerprint
+    )
+    previous_files = {} if full_rebuild else manifest.get('files', {})
+    if full_rebuild:
+        print("Full rebuild (environment or components changed)")
+
     # Process HTML files (recursive, excluding COPY_AS_IS directories)
-    html_files = []
-    for html_file in SRC_DIR.rglob("*.html"):
-        relative = html_file.relative_to(SRC_DIR)
-        if not any(relative.parts[0] == folder for folder in COPY_AS_IS):
-            html_files.append(html_file)
+    html_files = [Path(entry.path) for entry in walk_html()]
     processed_count = 0
+    skipped_count = 0
+    files = {}
+
+    html_files.sort()
+
+    # Create the output directory tree once instead of once per written file
+    for directory in {f.parent for f in html_files}:
+        (DIST_DIR / directory.relative_to(SRC_DIR)).mkdir(parents=True, exist_ok=True)
 
-    for html_file in sorted(html_files):
-        content = read_file(html_file)
+    entries = [previous_files.get(f.relative_to(SRC_DIR).as_posix()) for f in html_files]
+    worker = partial(process_page, header=header, footer=footer,
+                     replace=replace, asset_hashes=asset_hashes)
+
+    # Pages are independent: transform them in parallel, write from this process
+    if len(html_files) >= PARALLEL_MIN_FILES:
+        # Imported here: only needed for large sites
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # "spawn" avoids forking while the asset copy thread is running
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context) as executor:
+            results = list(executor.map(worker, html_files, entries, chunksize=8))
+    else:
+        results = list(map(worker, html_files, entries))
+
+    for html_file, (entry, action, processed) in zip(html_files, results):
         relative_path = html_file.relative_to(SRC_DIR)
+        out_path = DIST_DIR / relative_path
+        files[relative_path.as_posix()] = entry
 
-        # Check if file has markers
-        if HEADER_MARKER in content or FOOTER_MARKER in content:
-            processed = process_html(content, header, footer, html_file.name, env_vars)
-            write_file(DIST_DIR / relative_path, processed)
+        if action in ("skipped", "touched"):
+            skipped_count += 1
+        elif action == "static":
+            copy_file(html_file, out_path)
+            print(f"  Copied: {relative_path}")
+        elif action == "processed":
+            write_file(out_path, processed, create_dirs=False)
             print(f"  Processed: {relative_path}")
             processed_count += 1
         else:
-            # Still apply placeholder replacement
-            processed = replace_placeholders(content, env_vars)
-            write_file(DIST_DIR / relative_path, processed)
+            write_file(out_path, processed, create_dirs=False)
             print(f"  Copied: {relative_path}")
 
-    # Copy assets
-    for folder in COPY_AS_IS:
-        src = SRC_DIR / folder
-        if src.exists():
-            dst = DIST_DIR / folder
-            if src.is_dir():
-                shutil.copytree(src, dst)
-                print(f"  Copied folder: {folder}/")
-            else:
-                shutil.copy2(src, dst)
-                print(f"  Copied: {folder}")
+    # Remove outputs whose source was deleted since the previous build
+    for key in sorted(manifest.get('files', {}).keys() - files.keys()):
+        stale = DIST_DIR / key
+        if stale.exists():
+            stale.unlink()
+            print(f"  Removed: {key}")
+        # Drop folders left empty (e.g. a whole section deleted from src)
+        parent = stale.parent
+        while parent != DIST_DIR and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+    save_manifest({
+        'env_hash': env_hash,
+        'components_fingerprint': components_fingerprint,
+        'script_hash': script_hash,
+        'assets': assets,
+        'files': files,
+    })
+
+    # Wait for the asset copy started earlier
+    copied, removed = copy_future.result()
+    for name in copied:
+        print(f"  Copied folder: {name}" if name.endswith("/") else f"  Copied: {name}")
+    for name in removed:
+        print(f"  Removed: {name}")
+    copy_executor.shutdown()
 
     # Copy SEO files with placeholder replacement
     # robots.txt - choose based on production mode
     robots_src = ROBOTS_PRODUCTION if production_mode else ROBOTS_STAGING
     if robots_src.exists():
         robots_content = read_file(robots_src)
-        robots_content = replace_placeholders(robots_content, env_vars)
+        robots_content = replace(robots_content)
         write_file(DIST_DIR / "robots.txt", robots_content)
         print(f"  Processed: robots.txt ({mode.lower()})")
 
     # sitemap.xml - apply placeholder replacement for domain
     if SITEMAP_FILE.exists():
         sitemap_content = read_file(SITEMAP_FILE)
-        sitemap_content = replace_placeholders(sitemap_content, env_vars)
+        sitemap_content = replace(sitemap_content)
         write_file(DIST_DIR / "sitemap.xml", sitemap_content)
         print(f"  Processed: sitemap.xml")
 
     print(f"\nBuild complete!")
     print(f"  - Processed {processed_count} HTML files")
+    if skipped_count:
+        print(f"  - Skipped {skipped_count} unchanged HTML files")
     print(f"  - Output: {DIST_DIR}/")
     if not production_mode:
         print(f"\nNote: Staging mode - search engines blocked via robots.txt")
 
 
-def watch():
-    """Watch for changes and rebuild automatically."""
-    import time
+# Delay to collect related file events (e.g. editor save) into one rebuild
+WATCH_DEBOUNCE = 0.2
+
+
+def is_watched_file(path: Path) -> bool:
+    """Check if a changed file should trigger a rebuild in watch mode."""
+    try:
+        relative = path.relative_to(SRC_DIR)
+    except ValueError:
+        return False
+    if path.suffix == ".css":
+        return relative.parent == Path("assets", "css")
+    if path.suffix == ".html":
+        return relative.parts[0] not in COPY_AS_IS
+    return False
+
+
+def report_changes(changed) -> None:
+    """Print changed files and rebuild."""
     from datetime import datetime
 
+    print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Changes detected:")
+    for f in changed:
+        print(f"  - {f.name}")
+    build()
+
+
+def watch():
+    """Watch for changes and rebuild automatically."""
     print("Watching for changes... (Ctrl+C to stop)")
 
-    # Track file modification times
-    last_mtimes = {}
+    # Initial build
+    build()
+
+    # Prefer filesystem events (inotify, FSEvents...) over polling when available
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        print("Note: install watchdog for event-based watching, polling every second")
+        watch_polling()
+    else:
+        watch_events(Observer, FileSystemEventHandler)
+
+
+def watch_events(observer_class, handler_class):
+    """Rebuild on filesystem events pushed by watchdog."""
+    import time
+    import queue
+
+    changes = queue.Queue()
+
+    class ChangeHandler(handler_class):
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in ("created", "modified", "deleted", "moved"):
+                return
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if path and is_watched_file(Path(os.fsdecode(path))):
+                    changes.put(Path(os.fsdecode(path)))
+
+    observer = observer_class()
+    observer.schedule(ChangeHandler(), str(SRC_DIR), recursive=True)
+    observer.start()
+    try:
+        while True:
+            try:
+                changed = {changes.get(timeout=1)}
+            except queue.Empty:
+                continue
+
+            # Collect events that follow closely into the same rebuild
+            deadline = time.monotonic() + WATCH_DEBOUNCE
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    changed.add(changes.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            report_changes(sorted(changed))
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def watch_polling():
+    """Rebuild when file modification times change (checked every second)."""
+    import time
 
     def get_mtimes():
         mtimes = {}
         # Watch HTML files (recursive, excluding COPY_AS_IS)
-        for f in SRC_DIR.rglob("*.html"):
-            relative = f.relative_to(SRC_DIR)
-            if not any(relative.parts[0] == folder for folder in COPY_AS_IS):
-                mtimes[f] = f.stat().st_mtime
+        for entry in walk_html():
+            mtimes[Path(entry.path)] = entry.stat().st_mtime
         # Watch CSS
         css_dir = SRC_DIR / "assets" / "css"
         if css_dir.exists():
@@ -307,8 +767,7 @@ def watch():
                 mtimes[f] = f.stat().st_mtime
         return mtimes
 
-    # Initial build
-    build()
+    # Track file modification times
     last_mtimes = get_mtimes()
 
     while True:
@@ -321,10 +780,7 @@ def watch():
                 changed.append(f)
 
         if changed:
-            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Changes detected:")
-            for f in changed:
-                print(f"  - {f.name}")
-            build()
+            report_changes(changed)
             last_mtimes = current_mtimes
 
 
@@ -340,7 +796,7 @@ def main():
     parser.add_argument(
         "--clean", "-c",
         action="store_true",
-        help="Remove dist/ folder"
+        help="Remove dist/ folder and build cache (.build-cache.json)"
     )
     parser.add_argument(
         "--production", "-p",
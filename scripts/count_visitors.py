@@ -5,6 +5,10 @@ Visitor counter using Simple Analytics API.
 Incrementally counts visitors by fetching daily totals from Simple Analytics
 and adding them to a cumulative total. Keeps a daily history for analytics.
 
+Storage:
+  - visitor_count.json: current state (count, cumulative, last counted date)
+  - daily_history.csv:  append-only daily history (date,visitors)
+
 Strategy:
   - Each run: finalize any completed days, then fetch today's live count
   - Total = cumulative + today_visitors
@@ -19,13 +23,20 @@ Commands:
 
 import argparse
 import csv
+import http.client
 import json
 import os
+import shutil
 import sys
-import urllib.request
+import time
 from datetime import datetime, date, timedelta
 from pathlib import Path
 
+try:
+    import orjson  # optional, faster JSON (de)serialization
+except ImportError:
+    orjson = None
+
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -40,25 +51,96 @@ DOCKER_DATA_DIR = Path("/data")
 PROJECT_DATA_DIR = PROJECT_ROOT / "docker"
 DATA_DIR = DOCKER_DATA_DIR if DOCKER_DATA_DIR.exists() else PROJECT_DATA_DIR
 DATA_FILE = DATA_DIR / "visitor_count.json"
+HISTORY_FILE = DATA_DIR / "daily_history.csv"
 EXPORTS_DIR = DATA_DIR / "exports"
 
+# Simple Analytics API
+SA_HOST = "simpleanalytics.com"
+SA_TIMEOUT = 10
+SA_MAX_ATTEMPTS = 3
+SA_RETRY_DELAY = 1  # seconds, doubled after each failed attempt
+
+
+def sa_connect() -> http.client.HTTPSConnection:
+    """Open a connection to Simple Analytics, reusable across requests."""
+    return http.client.HTTPSConnection(SA_HOST, timeout=SA_TIMEOUT)
+
+
+def fetch_sa_json(path: str, conn: http.client.HTTPSConnection | None = None):
+    """
+    GET a JSON document from Simple Analytics.
+
+    Uses the given connection if any (left open for further requests),
+    otherwise a one-off connection. Retries with exponential backoff on
+    server errors (5xx), timeouts and connection errors. Raises the last
+    error if all attempts fail.
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = sa_connect()
 
-def fetch_sa_visitors_for_date(domain: str, day: str) -> int:
+    try:
+        for attempt in range(SA_MAX_ATTEMPTS):
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                # Connection is in an unknown state: reconnect on next request
+                conn.close()
+                error = e
+            else:
+                if response.status == 200:
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                    return orjson.loads(body) if orjson else json.loads(body)
+                error = http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+                if response.status < 500:
+                    raise error  # client errors won't succeed on retry
+            if attempt < SA_MAX_ATTEMPTS - 1:
+                time.sleep(SA_RETRY_DELAY * 2 ** attempt)
+        raise error
+    finally:
+        if own_conn:
+            conn.close()
+
+
+def fetch_sa_visitors_for_date(domain: str, day: str,
+                               conn: http.client.HTTPSConnection | None = None) -> int:
     """Fetch visitor count from Simple Analytics for a specific date (YYYY-MM-DD)."""
-    url = f"https://simpleanalytics.com/{domain}.json?version=6&fields=visitors&info=false&start={day}&end={day}"
+    path = f"/{domain}.json?version=6&fields=visitors&info=false&start={day}&end={day}"
 
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.load(response)
-            return data.get('visitors', 0)
-    except (urllib.error.HTTPError, urllib.error.URLError, json.JSONDecodeError) as e:
+        data = fetch_sa_json(path, conn)
+        return data.get('visitors', 0)
+    except (OSError, http.client.HTTPException, json.JSONDecodeError) as e:
         print(f"Error fetching {day}: {e}")
         return -1  # -1 = error, distinct from 0 visitors
 
 
+def fetch_sa_range(domain: str, start: str, end: str,
+                   conn: http.client.HTTPSConnection | None = None) -> dict:
+    """
+    Fetch daily visitor counts from Simple Analytics for a date range in one request.
+
+    Returns a {YYYY-MM-DD: visitors} dict built from the daily histogram,
+    or an empty dict on error (callers fall back to per-day requests).
+    """
+    path = (f"/{domain}.json?version=6&fields=histogram&interval=day&info=false"
+            f"&start={start}&end={end}")
+
+    try:
+        data = fetch_sa_json(path, conn)
+        return {entry['date']: entry.get('visitors', 0) for entry in data.get('histogram', [])}
+    except (OSError, http.client.HTTPException, json.JSONDecodeError, KeyError, TypeError) as e:
+        print(f"Error fetching {start} to {end}: {e}")
+        return {}
+
+
 def load_data() -> dict:
     """Load existing visitor data."""
     if DATA_FILE.exists():
+        if orjson:
+            return orjson.loads(DATA_FILE.read_bytes())
         with open(DATA_FILE, 'r') as f:
             return json.load(f)
     return {}
@@ -67,49 +149,122 @@ def load_data() -> dict:
 def save_data(data: dict) -> None:
     """Save visitor data to JSON file."""
     DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+    if orjson:
+        DATA_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(DATA_FILE, 'w') as f:
         json.dump(data, f, indent=2)
 
 
+def load_history(data: dict) -> dict:
+    """
+    Load the daily history as a {YYYY-MM-DD: visitors} dict.
+
+    Falls back to the legacy 'daily_history' key of the JSON data when the
+    CSV file has not been created yet.
+    """
+    if not HISTORY_FILE.exists():
+        return data.get('daily_history', {})
+
+    with open(HISTORY_FILE, 'r', newline='') as f:
+        return {row['date']: int(row['visitors']) for row in csv.DictReader(f)}
+
+
+def last_history_date():
+    """Return the date of the last row in the daily history CSV, if any."""
+    if not HISTORY_FILE.exists():
+        return None
+    with open(HISTORY_FILE, 'rb') as f:
+        # Only the tail is needed: rows are appended in date order
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 4096))
+        lines = f.read().decode('utf-8').splitlines()
+    last = lines[-1].split(',')[0] if lines else None
+    return None if last in (None, 'date') else last
+
+
+def append_history(days: list) -> None:
+    """
+    Append finalized (day, visitors) rows to the daily history CSV.
+
+    Days not later than the last recorded one are skipped, so re-finalizing
+    days after a run that failed before save_data() adds no duplicate rows.
+    """
+    last_day = last_history_date()
+    if last_day:
+        days = [(day, visitors) for day, visitors in days if day > last_day]
+    if not days:
+        return
+
+    HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    new_file = not HISTORY_FILE.exists()
+    with open(HISTORY_FILE, 'a', newline='') as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(['date', 'visitors'])
+        writer.writerows(days)
+
+
 def compute_stats(daily_history: dict) -> dict:
     """Compute average daily visitors for various periods."""
     if not daily_history:
         return {}
 
+    # ISO dates compare lexicographically: a single pass with running sums
     today = date.today()
-    sorted_days = sorted(daily_history.keys())
-
-    def avg_for_period(days_back):
-        cutoff = (today - timedelta(days=days_back)).isoformat()
-        values = [v for k, v in daily_history.items() if k >= cutoff and k < today.isoformat()]
-        if not values:
-            return None
-        return round(sum(values) / len(values), 1)
-
-    stats = {
-        'avg_7d': avg_for_period(7),
-        'avg_30d': avg_for_period(30),
-        'first_date': sorted_days[0],
-        'last_date': sorted_days[-1],
-        'total_days_tracked': len(sorted_days),
+    today_iso = today.isoformat()
+    cutoff_7 = (today - timedelta(days=7)).isoformat()
+    cutoff_30 = (today - timedelta(days=30)).isoformat()
+
+    sum_7 = count_7 = sum_30 = count_30 = sum_all = 0
+    max_day = min_day = None
+    first_date = last_date = None
+
+    for day, visitors in daily_history.items():
+        sum_all += visitors
+        if max_day is None or visitors > max_day:
+            max_day = visitors
+        if min_day is None or visitors < min_day:
+            min_day = visitors
+        if first_date is None or day < first_date:
+            first_date = day
+        if last_date is None or day > last_date:
+            last_date = day
+        if cutoff_30 <= day < today_iso:
+            sum_30 += visitors
+            count_30 += 1
+            if day >= cutoff_7:
+                sum_7 += visitors
+                count_7 += 1
+
+    total_days = len(daily_history)
+    return {
+        'avg_7d': round(sum_7 / count_7, 1) if count_7 else None,
+        'avg_30d': round(sum_30 / count_30, 1) if count_30 else None,
+        'first_date': first_date,
+        'last_date': last_date,
+        'total_days_tracked': total_days,
+        'avg_all_time': round(sum_all / total_days, 1),
+        'max_day': max_day,
+        'min_day': min_day,
     }
 
-    all_values = list(daily_history.values())
-    if all_values:
-        stats['avg_all_time'] = round(sum(all_values) / len(all_values), 1)
-        stats['max_day'] = max(all_values)
-        stats['min_day'] = min(all_values)
-
-    return stats
-
 
-def export_csv(data: dict) -> Path:
-    """Export visitor data as a CSV snapshot."""
+def export_csv(data: dict) -> tuple[Path, int]:
+    """Export visitor data as a CSV snapshot, returning its path and number of days."""
     EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime('%Y-%m')
     filepath = EXPORTS_DIR / f"visitors-{timestamp}.csv"
 
-    daily_history = data.get('daily_history', {})
+    # History CSV is already in export format (appended in date order)
+    if HISTORY_FILE.exists():
+        shutil.copyfile(HISTORY_FILE, filepath)
+        # Count data rows (every non-empty line after the header)
+        with open(filepath, 'rb') as f:
+            days = sum(1 for line in f if line.strip()) - 1
+        return filepath, max(days, 0)
+
+    daily_history = load_history(data)
     sorted_days = sorted(daily_history.keys())
 
     with open(filepath, 'w', newline='') as f:
@@ -118,7 +273,7 @@ def export_csv(data: dict) -> Path:
         for day in sorted_days:
             writer.writerow([day, daily_history[day]])
 
-    return filepath
+    return filepath, len(sorted_days)
 
 
 def cmd_status(data: dict) -> None:
@@ -129,7 +284,7 @@ def cmd_status(data: dict) -> None:
     print(f"  Last counted date: {data.get('last_counted_date', 'None')}")
     print(f"  Last updated:      {data.get('last_updated', 'Never')}")
 
-    daily_history = data.get('daily_history', {})
+    daily_history = load_history(data)
     if daily_history:
         stats = compute_stats(daily_history)
         print(f"\nDaily statistics ({stats['total_days_tracked']} days tracked):")
@@ -145,9 +300,8 @@ def cmd_status(data: dict) -> None:
 
 def cmd_export(data: dict) -> None:
     """Export monthly CSV snapshot."""
-    filepath = export_csv(data)
-    daily_history = data.get('daily_history', {})
-    print(f"Exported {len(daily_history)} days to {filepath}")
+    filepath, days = export_csv(data)
+    print(f"Exported {days} days to {filepath}")
 
 
 def cmd_update(domain: str) -> None:
@@ -157,7 +311,12 @@ def cmd_update(domain: str) -> None:
     today_str = today.isoformat()
     cumulative = prev.get('cumulative', 0)
     last_counted = prev.get('last_counted_date')
-    daily_history = prev.get('daily_history', {})
+
+    # Migration from history stored in the JSON file
+    legacy_history = prev.get('daily_history')
+    if legacy_history and not HISTORY_FILE.exists():
+        append_history(sorted(legacy_history.items()))
+        print(f"Migrated {len(legacy_history)} days of history to {HISTORY_FILE.name}")
 
     # First run or migration from old format
     if last_counted is None:
@@ -168,32 +327,43 @@ def cmd_update(domain: str) -> None:
         last_counted = today_str
         print(f"Initialized cumulative to {cumulative:,}")
 
+    # One connection (single TLS handshake) for all API requests of this run
+    conn = sa_connect()
+
     # Finalize completed days since last_counted_date
     last_date = date.fromisoformat(last_counted)
-    finalized_days = 0
+    finalized = []
 
     if last_date < today:
         d = last_date + timedelta(days=1)
+        # Fetch all completed days in a single request
+        range_visitors = {}
+        if d < today:
+            yesterday_str = (today - timedelta(days=1)).isoformat()
+            range_visitors = fetch_sa_range(domain, d.isoformat(), yesterday_str, conn)
         while d < today:
             day_str = d.isoformat()
-            visitors = fetch_sa_visitors_for_date(domain, day_str)
+            visitors = range_visitors.get(day_str)
+            if visitors is None:
+                # Day missing from range response: fetch it on its own
+                visitors = fetch_sa_visitors_for_date(domain, day_str, conn)
             if visitors < 0:
                 print(f"API error on {day_str}, will retry next run")
                 break
             cumulative += visitors
-            daily_history[day_str] = visitors
-            finalized_days += 1
+            # Advance day by day so a later API error never re-counts this one
+            last_counted = day_str
+            finalized.append((day_str, visitors))
             print(f"  {day_str}: +{visitors} visitors")
             d += timedelta(days=1)
-        else:
-            # All days finalized, update last_counted to yesterday
-            last_counted = (today - timedelta(days=1)).isoformat()
 
-    if finalized_days > 0:
-        print(f"Finalized {finalized_days} day(s), cumulative now: {cumulative:,}")
+    if finalized:
+        append_history(finalized)
+        print(f"Finalized {len(finalized)} day(s), cumulative now: {cumulative:,}")
 
     # Fetch today's live count (will be finalized tomorrow)
-    today_visitors = fetch_sa_visitors_for_date(domain, today_str)
+    today_visitors = fetch_sa_visitors_for_date(domain, today_str, conn)
+    conn.close()
     if today_visitors < 0:
         today_visitors = prev.get('today_visitors', 0)
         print(f"API error for today, keeping previous: {today_visitors}")
@@ -208,7 +378,6 @@ def cmd_update(domain: str) -> None:
         'last_counted_date': last_counted,
         'domain': domain,
         'last_updated': datetime.now().isoformat(),
-        'daily_history': daily_history,
     }
     save_data(data)
 